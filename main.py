@@ -1,8 +1,35 @@
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, request, jsonify
+from datetime import datetime, timezone
+import gzip
+import hashlib
 import itertools
+import os
+import random
+import threading
+import zlib
+from collections import OrderedDict
 
 app = Flask(__name__)
 
+# Fracción de respuestas de /calculate que se verifican contra la tabla de verdad (0.0 - 1.0)
+VERIFY_SAMPLE_RATE = float(os.environ.get('QM_VERIFY_SAMPLE_RATE', '1.0'))
+
+# Tamaño mínimo (en bytes) de una respuesta JSON para comprimirla con gzip/deflate
+COMPRESS_MIN_SIZE = int(os.environ.get('QM_COMPRESS_MIN_SIZE', '1024'))
+
+# Tamaño de cada bloque del cuerpo JSON que se entrega al compresor
+COMPRESS_CHUNK_SIZE = 64 * 1024
+
+# Cantidad de tablas de cobertura retenidas para servir por bloques en /coverage
+RESULT_CACHE_SIZE = int(os.environ.get('QM_RESULT_CACHE_SIZE', '64'))
+
+# Celdas máximas de la matriz de cobertura enviadas completas en formato compacto;
+# por encima de este límite el navegador pide la tabla por bloques
+INLINE_COVERAGE_CELLS = int(os.environ.get('QM_INLINE_COVERAGE_CELLS', '4096'))
+
+# Filas y columnas máximas de un bloque de /coverage
+MAX_TILE_SIZE = 256
+
 class QuineMcCluskey:
     def __init__(self, minterms, dont_cares=None):
         self.minterms = minterms
@@ -205,6 +232,122 @@ class QuineMcCluskey:
             'steps': self.steps
         }
 
+class TruthTableVerifier:
+    """Verifica una solución contra la función original usando tablas de verdad empaquetadas.
+
+    Cada tabla de verdad es un entero de 2^n bits donde el bit m vale 1 si el
+    minterm m pertenece al conjunto, de modo que las comparaciones se hacen en
+    bloque con operaciones de bits en lugar de minterm por minterm.
+    """
+
+    def __init__(self, minterms, dont_cares, num_vars):
+        self.num_vars = num_vars
+        self.on_set = self.terms_to_bits(minterms)
+        self.dc_set = self.terms_to_bits(dont_cares) & ~self.on_set
+        self.off_set = ((1 << (1 << num_vars)) - 1) & ~(self.on_set | self.dc_set)
+
+    def terms_to_bits(self, terms):
+        bits = 0
+        for term in terms:
+            bits |= 1 << term
+        return bits
+
+    def cube_to_bits(self, cube):
+        # Se parte del minterm con los guiones en 0 y se duplica el patrón por cada guion
+        base = int(cube.replace('-', '0'), 2) if cube else 0
+        bits = 1 << base
+        for i, bit in enumerate(cube):
+            if bit == '-':
+                bits |= bits << (1 << (self.num_vars - i - 1))
+        return bits
+
+    def cubes_to_bits(self, cubes):
+        bits = 0
+        for cube in cubes:
+            bits |= self.cube_to_bits(cube)
+        return bits
+
+    def expression_to_cubes(self, expression):
+        """Convierte una suma de productos como "AB' + C" en cubos binarios con guiones"""
+        variables = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H'][:self.num_vars]
+        cubes = []
+        for product in expression.split('+'):
+            product = product.strip()
+            if not product:
+                continue
+            cube = ['-'] * self.num_vars
+            if product != '1':
+                i = 0
+                while i < len(product):
+                    var = product[i]
+                    if var not in variables:
+                        raise ValueError(f'Variable desconocida en la expresión: {var}')
+                    negated = i + 1 < len(product) and product[i + 1] == "'"
+                    cube[variables.index(var)] = '0' if negated else '1'
+                    i += 2 if negated else 1
+            cubes.append(''.join(cube))
+        return cubes
+
+    def bits_to_terms(self, bits):
+        terms = []
+        while bits:
+            low = bits & -bits
+            terms.append(low.bit_length() - 1)
+            bits ^= low
+        return terms
+
+    def compare(self, cover):
+        return {
+            'uncovered_minterms': self.bits_to_terms(self.on_set & ~cover),
+            'covered_maxterms': self.bits_to_terms(self.off_set & cover)
+        }
+
+    def verify(self, result):
+        essential_cover = self.cubes_to_bits(impl for impl, _ in result['essential_implicants'])
+        essential = self.compare(essential_cover)
+        try:
+            expression = self.compare(self.cubes_to_bits(self.expression_to_cubes(result['expression'])))
+        except ValueError as e:
+            expression = {'error': str(e)}
+
+        valid = (not essential['uncovered_minterms'] and not essential['covered_maxterms']
+                 and not expression.get('error')
+                 and not expression['uncovered_minterms'] and not expression['covered_maxterms'])
+        return {
+            'valid': valid,
+            'essential_implicants': essential,
+            'expression': expression
+        }
+
+class ResultCache:
+    """Caché LRU de las tablas de cobertura resueltas, indexada por identificador de problema"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def problem_id(minterms, dont_cares):
+        key = ','.join(map(str, sorted(set(minterms)))) + '|' + ','.join(map(str, sorted(set(dont_cares))))
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+    def get(self, problem_id):
+        with self.lock:
+            entry = self.entries.get(problem_id)
+            if entry is not None:
+                self.entries.move_to_end(problem_id)
+            return entry
+
+    def put(self, problem_id, entry):
+        with self.lock:
+            self.entries[problem_id] = entry
+            self.entries.move_to_end(problem_id)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+result_cache = ResultCache(RESULT_CACHE_SIZE)
+
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
 <html lang="es">
@@ -489,6 +632,51 @@ HTML_TEMPLATE = '''
             background: #ecf0f1;
         }
         
+        /* Tabla virtualizada: tamaño fijo de celdas para calcular la ventana visible */
+        .coverage-table.virtual {
+            width: auto;
+        }
+        
+        .coverage-table.virtual tbody td {
+            height: 40px;
+            padding: 0 8px;
+            overflow: hidden;
+        }
+        
+        .coverage-table.virtual th:not(:first-child),
+        .coverage-table.virtual .covered-cell {
+            width: 50px;
+            min-width: 50px;
+            max-width: 50px;
+            padding: 0;
+        }
+        
+        .coverage-table.virtual .spacer,
+        .coverage-table.virtual th.spacer {
+            border: none;
+            padding: 0;
+            background: transparent;
+        }
+        
+        .coverage-table .covered-cell.loading-cell {
+            background: repeating-linear-gradient(45deg, #f1f1f1, #f1f1f1 6px, #e0e0e0 6px, #e0e0e0 12px);
+        }
+        
+        .coverage-table .covered-cell.error-cell {
+            background: #fdecea;
+        }
+        
+        .coverage-table .tile-error {
+            caption-side: top;
+            text-align: left;
+            padding: 8px 15px;
+            background: #fdecea;
+            color: #c0392b;
+            font-weight: 600;
+            position: sticky;
+            left: 0;
+        }
+        
         .essential-badge {
             background: #43e97b;
             color: #1a1a1a;
@@ -553,6 +741,152 @@ HTML_TEMPLATE = '''
             return differences.join(',');
         }
         
+        // Dimensiones fijas de la tabla de cobertura virtualizada
+        const ROW_HEIGHT = 40;
+        const COL_WIDTH = 50;
+        const TILE_SIZE = 64;
+        const OVERSCAN = 4;
+        const MAX_TILE_ATTEMPTS = 3;
+        
+        function renderCoverageTable(wrapper, matrix, data, problem) {
+            // Solo se dibuja la ventana visible; si la matriz no vino en la respuesta
+            // se piden bloques de TILE_SIZE x TILE_SIZE a /coverage
+            const numRows = matrix.rows.length;
+            const numCols = matrix.columns.length;
+            const decodedRows = new Map();
+            const tiles = new Map();
+            const attempts = new Map();
+            let tileError = null;
+            let pending = false;
+            
+            function requestTile(tr, tc) {
+                const key = tr + ',' + tc;
+                tiles.set(key, { loading: true });
+                // Se envían los términos para que el servidor pueda recalcular si perdió el resultado
+                const params = new URLSearchParams({
+                    row: tr * TILE_SIZE,
+                    col: tc * TILE_SIZE,
+                    rows: TILE_SIZE,
+                    cols: TILE_SIZE,
+                    minterms: problem.minterms,
+                    dontcares: problem.dontcares
+                });
+                fetch(`/coverage/${data.problem_id}?${params}`)
+                    .then(response => response.json())
+                    .then(tile => {
+                        if (tile.error) {
+                            throw new Error(tile.error);
+                        }
+                        // Las filas del bloque deben coincidir con las etiquetas de esta tabla
+                        const matches = tile.num_rows === numRows && tile.num_cols === numCols
+                            && tile.rows.every((impl, i) => impl === data.implicants[matrix.rows[tile.row + i]][0]);
+                        if (!matches) {
+                            throw new Error('El bloque recibido no corresponde a esta tabla');
+                        }
+                        tiles.set(key, { rows: tile.bits.map(hex => decodeBitRow(hex, tile.columns.length)) });
+                        scheduleRender();
+                    })
+                    .catch(error => {
+                        const count = (attempts.get(key) || 0) + 1;
+                        attempts.set(key, count);
+                        if (count < MAX_TILE_ATTEMPTS) {
+                            // Reintentar más tarde: al borrar la clave el siguiente dibujo la vuelve a pedir
+                            setTimeout(() => {
+                                tiles.delete(key);
+                                scheduleRender();
+                            }, 500 * count);
+                        } else {
+                            tiles.set(key, { error: true });
+                            tileError = error.message;
+                            scheduleRender();
+                        }
+                    });
+            }
+            
+            function cellClass(r, c) {
+                if (matrix.bits) {
+                    if (!decodedRows.has(r)) {
+                        decodedRows.set(r, decodeBitRow(matrix.bits[r], numCols));
+                    }
+                    return decodedRows.get(r)[c] ? 'has-cover' : '';
+                }
+                const tr = Math.floor(r / TILE_SIZE);
+                const tc = Math.floor(c / TILE_SIZE);
+                const key = tr + ',' + tc;
+                if (!tiles.has(key)) {
+                    requestTile(tr, tc);
+                }
+                const tile = tiles.get(key);
+                if (tile.loading) {
+                    return 'loading-cell';
+                }
+                if (tile.error) {
+                    return 'error-cell';
+                }
+                return tile.rows[r - tr * TILE_SIZE][c - tc * TILE_SIZE] ? 'has-cover' : '';
+            }
+            
+            function render() {
+                pending = false;
+                const r0 = Math.max(0, Math.floor(wrapper.scrollTop / ROW_HEIGHT) - OVERSCAN);
+                const r1 = Math.min(numRows, Math.ceil((wrapper.scrollTop + wrapper.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+                const c0 = Math.max(0, Math.floor(wrapper.scrollLeft / COL_WIDTH) - OVERSCAN);
+                const c1 = Math.min(numCols, Math.ceil((wrapper.scrollLeft + wrapper.clientWidth) / COL_WIDTH) + OVERSCAN);
+                const span = c1 - c0 + 3;
+                
+                let html = `<table class="coverage-table virtual">`;
+                if (tileError) {
+                    html += `<caption class="tile-error">No se pudo cargar parte de la tabla: ${tileError}</caption>`;
+                }
+                html += `
+                    <thead>
+                        <tr>
+                            <th style="background: #34495e;">Implicante</th>
+                            <th class="spacer" style="width: ${c0 * COL_WIDTH}px; min-width: ${c0 * COL_WIDTH}px;"></th>`;
+                for (let c = c0; c < c1; c++) {
+                    html += `<th>${matrix.columns[c]}</th>`;
+                }
+                html += `<th class="spacer" style="width: ${(numCols - c1) * COL_WIDTH}px; min-width: ${(numCols - c1) * COL_WIDTH}px;"></th>
+                    </tr></thead><tbody>`;
+                html += `<tr><td class="spacer" colspan="${span}" style="height: ${r0 * ROW_HEIGHT}px;"></td></tr>`;
+                for (let r = r0; r < r1; r++) {
+                    const displayImpl = getBinaryDifference(data.implicants[matrix.rows[r]][0]);
+                    html += `<tr>
+                        <td class="impl-cell">${displayImpl}</td>
+                        <td class="spacer"></td>`;
+                    for (let c = c0; c < c1; c++) {
+                        html += `<td class="covered-cell ${cellClass(r, c)}"></td>`;
+                    }
+                    html += `<td class="spacer"></td></tr>`;
+                }
+                html += `<tr><td class="spacer" colspan="${span}" style="height: ${(numRows - r1) * ROW_HEIGHT}px;"></td></tr>`;
+                html += `</tbody></table>`;
+                wrapper.innerHTML = html;
+            }
+            
+            function scheduleRender() {
+                if (!pending) {
+                    pending = true;
+                    requestAnimationFrame(render);
+                }
+            }
+            
+            wrapper.addEventListener('scroll', scheduleRender);
+            render();
+        }
+        
+        function decodeBitRow(hex, numCols) {
+            // Fila de la matriz de cobertura en hexadecimal: bit j = columna j
+            const row = new Uint8Array(numCols);
+            for (let k = 0; k < hex.length; k++) {
+                const nibble = parseInt(hex[hex.length - 1 - k], 16);
+                for (let b = 0; b < 4 && k * 4 + b < numCols; b++) {
+                    row[k * 4 + b] = (nibble >> b) & 1;
+                }
+            }
+            return row;
+        }
+        
         document.getElementById('qmForm').addEventListener('submit', async function(e) {
             e.preventDefault();
             
@@ -570,7 +904,8 @@ HTML_TEMPLATE = '''
                     },
                     body: JSON.stringify({
                         minterms: minterms,
-                        dontcares: dontcares
+                        dontcares: dontcares,
+                        format: 'compact'
                     })
                 });
                 
@@ -581,7 +916,7 @@ HTML_TEMPLATE = '''
                     return;
                 }
                 
-                displayResults(data);
+                displayResults(data, { minterms: minterms, dontcares: dontcares });
             } catch (error) {
                 alert('Error al procesar: ' + error.message);
             } finally {
@@ -589,8 +924,9 @@ HTML_TEMPLATE = '''
             }
         });
         
-        function displayResults(data) {
+        function displayResults(data, problem) {
             const resultsDiv = document.getElementById('results');
+            const coverageTables = [];
             let html = '';
             
             data.steps.forEach((step, index) => {
@@ -602,7 +938,8 @@ HTML_TEMPLATE = '''
                     for (const [ones, terms] of Object.entries(step.groups)) {
                         html += `<div class="group">
                             <div class="group-header">Grupo ${ones} (${ones} uno${ones != 1 ? 's' : ''})</div>`;                        
-                        terms.forEach(([binary, decimals]) => {
+                        terms.forEach(idx => {
+                            const [binary, decimals] = data.implicants[idx];
                             // Mostrar binario en paso 1, números naturales desde paso 2
                             const display = step.show_binary ? binary : getBinaryDifference(binary);
                             html += `<div class="term">
@@ -615,57 +952,15 @@ HTML_TEMPLATE = '''
                 }
                 
                 if (step.coverage_matrix) {
-                    // Obtener todos los minterms ordenados
-                    const allMinterms = Object.keys(step.coverage).map(Number).sort((a, b) => a - b);
-                    const impls = Object.keys(step.coverage_matrix);
-                    
-                    html += `<div class="table-wrapper"><table class="coverage-table">
-                        <thead>
-                            <tr>
-                                <th style="background: #34495e;">Implicante</th>`;                    
-                    allMinterms.forEach(minterm => {
-                        html += `<th>${minterm}</th>`;
-                    });                    
-                    html += `</tr></thead><tbody>`;                    
-                    impls.forEach(impl => {
-                        const data = step.coverage_matrix[impl];
-                        const displayImpl = getBinaryDifference(impl);
-                        html += `<tr>
-                            <td class="impl-cell">${displayImpl}</td>`;                        
-                        allMinterms.forEach(minterm => {
-                            const isCovered = data.covers.includes(minterm);
-                            html += `<td class="covered-cell ${isCovered ? 'has-cover' : ''}"></td>`;
-                        });                        
-                        html += `</tr>`;
-                    });                    
-                    html += `</tbody></table></div>`;
-                }
-                
-                if (step.coverage && !step.coverage_matrix) {
-                    html += `<div class="table-wrapper"><table class="coverage-table">
-                        <thead>
-                            <tr>
-                                <th>Minterm</th>
-                                <th>Implicantes Primos que lo cubren</th>
-                            </tr>
-                        </thead>
-                        <tbody>`;                    
-                    for (const [minterm, impls] of Object.entries(step.coverage)) {
-                        html += `<tr>
-                            <td>${minterm}</td>
-                            <td>`;                        
-                        impls.forEach(([impl, decs]) => {
-                            const diff = getBinaryDifference(impl);
-                            html += `<span class="term">${diff}</span> `;
-                        });
-                        html += `</td></tr>`;
-                    }                    
-                    html += `</tbody></table></div>`;
+                    // La tabla se dibuja virtualizada una vez insertado el HTML
+                    coverageTables.push({ id: `coverage-${index}`, matrix: step.coverage_matrix });
+                    html += `<div class="table-wrapper" id="coverage-${index}"></div>`;
                 }
                 
                 if (step.essential) {
                     html += `<div class="group">`;
-                    step.essential.forEach(([impl, decs]) => {
+                    step.essential.forEach(idx => {
+                        const [impl, decs] = data.implicants[idx];
                         const diff = getBinaryDifference(impl);
                         html += `<span class="term">
                             <span class="essential-badge">ESENCIAL</span>
@@ -687,6 +982,9 @@ HTML_TEMPLATE = '''
             
             resultsDiv.innerHTML = html;
             resultsDiv.style.display = 'block';
+            coverageTables.forEach(({ id, matrix }) => {
+                renderCoverageTable(document.getElementById(id), matrix, data, problem);
+            });
             resultsDiv.scrollIntoView({ behavior: 'smooth' });
         }
     </script>
@@ -694,9 +992,127 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+# La página se compila y comprime una sola vez al iniciar la aplicación
+INDEX_HTML = app.jinja_env.from_string(HTML_TEMPLATE).render().encode('utf-8')
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML, mtime=0)
+INDEX_ETAG = hashlib.sha256(INDEX_HTML).hexdigest()[:32]
+# Fecha estable entre workers y reinicios: la del archivo que contiene la plantilla
+INDEX_LAST_MODIFIED = datetime.fromtimestamp(os.path.getmtime(__file__), timezone.utc).replace(microsecond=0)
+
+def coverage_bit_rows(step):
+    """Devuelve columnas (minterms ordenados), implicantes por fila y cada fila como entero de bits.
+
+    Las filas se ordenan por implicante: el orden de los implicantes primos depende del hash de
+    cadenas de cada proceso, y los bloques de /coverage pueden venir de otro worker.
+    """
+    columns = sorted(int(m) for m in step['coverage'])
+    position = {m: j for j, m in enumerate(columns)}
+    rows = []
+    bits = []
+    for impl, data in sorted(step['coverage_matrix'].items()):
+        rows.append((impl, data['decimals']))
+        row_bits = 0
+        for m in data['covers']:
+            row_bits |= 1 << position[m]
+        bits.append(row_bits)
+    return columns, rows, bits
+
+def cache_coverage(problem_id, result):
+    """Retiene la tabla de cobertura del resultado para servirla por bloques en /coverage"""
+    for step in result['steps']:
+        if 'coverage_matrix' in step:
+            columns, rows, bits = coverage_bit_rows(step)
+            result_cache.put(problem_id, {'columns': columns, 'rows': [t for t, _ in rows], 'bits': bits})
+
+def encode_compact(result):
+    """Codifica el resultado en formato compacto: cada implicante aparece una sola vez en
+    'implicants' y el resto de la respuesta lo referencia por índice. La matriz de cobertura
+    se envía como filas de bits en hexadecimal (bit j = columna j)."""
+    implicants = []
+    index = {}
+
+    def intern(term, decimals):
+        if term not in index:
+            index[term] = len(implicants)
+            implicants.append([term, list(decimals)])
+        return index[term]
+
+    steps = []
+    for step in result['steps']:
+        compact = {key: step[key] for key in ('title', 'description', 'show_binary', 'covered', 'expression')
+                   if key in step}
+        if 'groups' in step:
+            compact['groups'] = {ones: [intern(t, d) for t, d in terms] for ones, terms in step['groups'].items()}
+        if 'used_terms' in step:
+            compact['used_terms'] = [index[t] for t in step['used_terms']]
+        if 'coverage_matrix' in step:
+            columns, rows, bits = coverage_bit_rows(step)
+            compact['coverage_matrix'] = {'columns': columns, 'rows': [intern(t, d) for t, d in rows]}
+            # Las matrices grandes no se envían: el navegador las pide por bloques a /coverage
+            if len(rows) * len(columns) <= INLINE_COVERAGE_CELLS:
+                compact['coverage_matrix']['bits'] = [format(b, 'x') for b in bits]
+        if 'prime_implicants' in step:
+            compact['prime_implicants'] = [intern(t, d) for t, d in step['prime_implicants']]
+        if 'essential' in step:
+            compact['essential'] = [intern(t, d) for t, d in step['essential']]
+        if 'essential_impls' in step:
+            compact['essential_impls'] = [index[t] for t in step['essential_impls']]
+        steps.append(compact)
+
+    encoded = {
+        'format': 'compact',
+        'implicants': implicants,
+        'prime_implicants': [intern(t, d) for t, d in result['prime_implicants']],
+        'essential_implicants': [intern(t, d) for t, d in result['essential_implicants']],
+        'expression': result['expression'],
+        'steps': steps
+    }
+    for key in ('verification', 'problem_id'):
+        if key in result:
+            encoded[key] = result[key]
+    return encoded
+
+def json_response(payload):
+    """Devuelve el JSON comprimido en streaming si el cliente lo acepta y supera COMPRESS_MIN_SIZE"""
+    encoding = request.accept_encodings.best_match(['gzip', 'deflate'])
+    if not encoding:
+        response = jsonify(payload)
+    else:
+        # El resultado ya está en memoria: se codifica de una vez con el codificador en C
+        body = app.json.dumps(payload).encode('utf-8')
+        if len(body) < COMPRESS_MIN_SIZE:
+            response = Response(body, mimetype='application/json')
+        else:
+            def generate():
+                # wbits=31 produce formato gzip, wbits=15 formato zlib (Content-Encoding: deflate)
+                compressor = zlib.compressobj(wbits=31 if encoding == 'gzip' else 15)
+                for start in range(0, len(body), COMPRESS_CHUNK_SIZE):
+                    data = compressor.compress(body[start:start + COMPRESS_CHUNK_SIZE])
+                    if data:
+                        yield data
+                yield compressor.flush()
+
+            response = Response(generate(), mimetype='application/json')
+            response.headers['Content-Encoding'] = encoding
+
+    # La representación depende de Accept-Encoding aunque no se comprima
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    use_gzip = request.accept_encodings.best_match(['gzip']) == 'gzip'
+    response = Response(INDEX_HTML_GZIP if use_gzip else INDEX_HTML, mimetype='text/html')
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(INDEX_ETAG + ('-gzip' if use_gzip else ''))
+    response.last_modified = INDEX_LAST_MODIFIED
+    response.cache_control.no_cache = True
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)
+
+def parse_terms(terms_str):
+    return [int(x.strip()) for x in terms_str.split(',') if x.strip()] if terms_str else []
 
 @app.route('/calculate', methods=['POST'])
 def calculate():
@@ -704,12 +1120,10 @@ def calculate():
         data = request.json
         
         # Parsear minterms
-        minterms_str = data.get('minterms', '')
-        minterms = [int(x.strip()) for x in minterms_str.split(',') if x.strip()]
+        minterms = parse_terms(data.get('minterms', ''))
         
         # Parsear don't cares
-        dontcares_str = data.get('dontcares', '')
-        dontcares = [int(x.strip()) for x in dontcares_str.split(',') if x.strip()] if dontcares_str else []
+        dontcares = parse_terms(data.get('dontcares', ''))
         
         if not minterms:
             return jsonify({'error': 'Debe ingresar al menos un mintérmino'})
@@ -717,11 +1131,84 @@ def calculate():
         # Ejecutar algoritmo
         qm = QuineMcCluskey(minterms, dontcares)
         result = qm.solve()
-        
-        return jsonify(result)
+
+        # Verificación por muestreo de la solución contra la tabla de verdad
+        if VERIFY_SAMPLE_RATE > 0 and random.random() < VERIFY_SAMPLE_RATE:
+            # Un fallo del verificador nunca debe reemplazar la respuesta del algoritmo
+            try:
+                verifier = TruthTableVerifier(qm.minterms, qm.dont_cares, qm.num_vars)
+                report = verifier.verify(result)
+            except Exception:
+                app.logger.exception('Error al verificar la solución: minterms=%s dontcares=%s',
+                                     minterms, dontcares)
+                result['verification'] = {'error': 'No se pudo verificar la solución'}
+            else:
+                # La respuesta solo lleva el resumen; el detalle de los minterms va al log
+                mismatches = set()
+                for check in (report['essential_implicants'], report['expression']):
+                    mismatches.update(check.get('uncovered_minterms', []))
+                    mismatches.update(check.get('covered_maxterms', []))
+                result['verification'] = {'valid': report['valid'], 'mismatches': len(mismatches)}
+                if not report['valid']:
+                    app.logger.warning('Solución no coincide con la función: minterms=%s dontcares=%s verificación=%s',
+                                       minterms, dontcares, report)
+
+        # Retener la tabla de cobertura para servirla por bloques
+        problem_id = ResultCache.problem_id(minterms, dontcares)
+        cache_coverage(problem_id, result)
+        result['problem_id'] = problem_id
+
+        # Formato compacto opcional (implicantes indexados y matriz de cobertura en bits)
+        if data.get('format') == 'compact':
+            result = encode_compact(result)
+
+        return json_response(result)
     
     except Exception as e:
         return jsonify({'error': str(e)})
 
+@app.route('/coverage/<problem_id>')
+def coverage(problem_id):
+    """Devuelve un bloque de filas y columnas de la tabla de cobertura de un problema resuelto.
+
+    Si la tabla ya no está en la caché (expulsada o retenida por otro worker) y la petición
+    incluye 'minterms' y 'dontcares', se vuelve a resolver el problema.
+    """
+    try:
+        row = max(0, int(request.args.get('row', 0)))
+        col = max(0, int(request.args.get('col', 0)))
+        num_rows = min(MAX_TILE_SIZE, max(0, int(request.args.get('rows', 64))))
+        num_cols = min(MAX_TILE_SIZE, max(0, int(request.args.get('cols', 64))))
+    except ValueError:
+        return jsonify({'error': 'Parámetros de bloque inválidos'}), 400
+
+    table = result_cache.get(problem_id)
+    if table is None and request.args.get('minterms'):
+        try:
+            minterms = parse_terms(request.args.get('minterms'))
+            dontcares = parse_terms(request.args.get('dontcares', ''))
+        except ValueError:
+            return jsonify({'error': 'Mintérminos o don\'t cares inválidos'}), 400
+        if minterms and ResultCache.problem_id(minterms, dontcares) == problem_id:
+            try:
+                cache_coverage(problem_id, QuineMcCluskey(minterms, dontcares).solve())
+            except Exception as e:
+                return jsonify({'error': str(e)}), 400
+            table = result_cache.get(problem_id)
+    if table is None:
+        return jsonify({'error': 'Resultado no disponible, vuelva a calcular'}), 404
+
+    columns = table['columns'][col:col + num_cols]
+    mask = (1 << len(columns)) - 1
+    return json_response({
+        'row': row,
+        'col': col,
+        'num_rows': len(table['rows']),
+        'num_cols': len(table['columns']),
+        'rows': table['rows'][row:row + num_rows],
+        'columns': columns,
+        'bits': [format((b >> col) & mask, 'x') for b in table['bits'][row:row + num_rows]]
+    })
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file